@@ -0,0 +1,442 @@
+import argparse
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from contextlib import ExitStack
+
+# Compact columnar snapshot of the lead corpus (*.agls).
+#
+# Layout (all integers in the byte order recorded in the header):
+#   header:  MAGIC | version u8 | byteorder u8 | rows u32 | columns u16
+#   per column: name_len u16 | name utf8 | kind u8 | offset u64 | size u64
+#   column blocks, each aligned to 8 bytes
+#
+# Every column block starts with states u8[rows] (0 = key missing,
+# 1 = explicit null, 2 = value), padded to 8 bytes, followed by:
+#   "s" string      -> width u8 | pad | zlib(offsets u32/u64[rows + 1] | utf8 data)
+#   "d" dictionary  -> entries u32 | pad | offsets u64[entries + 1] | utf8 data | pad | codes u32[rows]
+#   "i" integer     -> values i64[rows]
+#   "f" float       -> values f64[rows]
+#   "b" boolean     -> values u8[rows]
+#   "j" json        -> same as "s", values are JSON encoded
+#
+# Keeping missing keys apart from explicit nulls makes rows decode to the
+# same dicts as the JSON they were written from.
+#
+# Numeric columns and dictionary codes are exposed straight from the mapped
+# file through memoryview casts, so scanning them never copies the data.
+# String columns are zlib compressed and inflated on first access, so a
+# scan that only touches numbers never pays for the text.
+
+MAGIC = b"AGLS"
+VERSION = 2
+SNAPSHOT_EXTENSION = ".agls"
+
+# Low-cardinality columns stored once per distinct value
+DICTIONARY_COLUMNS = ("city", "category")
+
+MISSING, NULL, PRESENT = 0, 1, 2
+BYTEORDER = {"little": 0, "big": 1}
+
+INT64_MIN, INT64_MAX = -2**63, 2**63 - 1
+UINT32_MAX = 2**32 - 1
+
+CAMPAIGN_CSV_FIELDS = ["company", "status", "subject", "email_body", "phone_number", "reasoning"]
+
+_MISSING = object()
+
+
+def _align(n):
+    return (n + 7) & ~7
+
+
+def _pad(data):
+    return data + b"\0" * (_align(len(data)) - len(data))
+
+
+def _infer_kind(name, values):
+    present = [v for v in values if v is not None and v is not _MISSING]
+    if name in DICTIONARY_COLUMNS and all(isinstance(v, str) for v in present):
+        return "d"
+    if not present:
+        return "s"
+    if all(isinstance(v, bool) for v in present):
+        return "b"
+    if all(isinstance(v, int) and not isinstance(v, bool) for v in present):
+        # Integers beyond i64 keep their exact value as JSON, as do
+        # int/float mixes, which f64 would silently turn into floats
+        if all(INT64_MIN <= v <= INT64_MAX for v in present):
+            return "i"
+        return "j"
+    if all(isinstance(v, float) for v in present):
+        return "f"
+    if all(isinstance(v, str) for v in present):
+        return "s"
+    return "j"
+
+
+def _encode_strings(values, typecode="Q"):
+    offsets = array(typecode, [0])
+    data = bytearray()
+    for v in values:
+        if isinstance(v, str):
+            data += v.encode("utf-8")
+        offsets.append(len(data))
+    return offsets.tobytes() + bytes(data)
+
+
+def _encode_compressed_strings(values):
+    # u32 offsets unless the column holds more than 4 GiB of text
+    total = sum(len(v.encode("utf-8")) for v in values if isinstance(v, str))
+    typecode = "I" if total <= UINT32_MAX else "Q"
+    payload = zlib.compress(_encode_strings(values, typecode), 6)
+    return _pad(struct.pack("=B", array(typecode).itemsize)) + payload
+
+
+def _encode_column(kind, values):
+    states = _pad(bytes(MISSING if v is _MISSING else NULL if v is None else PRESENT for v in values))
+    values = [None if v is _MISSING else v for v in values]
+
+    if kind in ("s", "j"):
+        if kind == "j":
+            values = [None if v is None else json.dumps(v, ensure_ascii=False) for v in values]
+        return states + _encode_compressed_strings(values)
+
+    if kind == "d":
+        dictionary = {}
+        codes = array("I")
+        for v in values:
+            codes.append(0 if v is None else dictionary.setdefault(v, len(dictionary)))
+        head = _pad(struct.pack("=I", len(dictionary))) + _encode_strings(list(dictionary))
+        return states + _pad(head) + codes.tobytes()
+
+    if kind == "b":
+        return states + bytes(int(bool(v)) for v in values)
+
+    typecode = "q" if kind == "i" else "d"
+    numbers = array(typecode, (0 if v is None else v for v in values))
+    return states + numbers.tobytes()
+
+
+def write_snapshot(leads, path):
+    """
+    Writes a list of lead dicts to a columnar snapshot file.
+    Returns the number of rows written.
+    """
+    leads = list(leads)
+    if len(leads) > UINT32_MAX:
+        raise ValueError(f"Snapshots hold at most {UINT32_MAX} leads, got {len(leads)}")
+    names = list(dict.fromkeys(key for lead in leads for key in lead))
+
+    columns = []
+    for name in names:
+        values = [lead.get(name, _MISSING) for lead in leads]
+        kind = _infer_kind(name, values)
+        columns.append((name, kind, _encode_column(kind, values)))
+
+    header = bytearray(MAGIC)
+    header += struct.pack("=BBIH", VERSION, BYTEORDER[sys.byteorder], len(leads), len(columns))
+    directory_size = sum(2 + len(name.encode("utf-8")) + 1 + 16 for name, _, _ in columns)
+
+    offset = _align(len(header) + directory_size)
+    blocks = []
+    for name, kind, block in columns:
+        encoded_name = name.encode("utf-8")
+        header += struct.pack("=H", len(encoded_name)) + encoded_name
+        header += struct.pack("=cQQ", kind.encode("ascii"), offset, len(block))
+        blocks.append((offset, block))
+        offset = _align(offset + len(block))
+
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            for block_offset, block in blocks:
+                f.write(b"\0" * (block_offset - f.tell()))
+                f.write(block)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return len(leads)
+
+
+class _Column:
+    def __init__(self, buf, rows):
+        self.states = buf[:rows]
+        self._payload = _align(rows)
+
+    def present(self, i):
+        return self.states[i] != MISSING
+
+
+class _StringColumn(_Column):
+    def __init__(self, buf, rows, as_json=False):
+        super().__init__(buf, rows)
+        (self._width,) = struct.unpack_from("=B", buf, self._payload)
+        self._compressed = buf[self._payload + 8:]
+        self._rows = rows
+        self._offsets = None
+        self._data = None
+        self._as_json = as_json
+
+    def _inflate(self):
+        raw = zlib.decompress(self._compressed)
+        split = (self._rows + 1) * self._width
+        self._offsets = memoryview(raw)[:split].cast("I" if self._width == 4 else "Q")
+        self._data = memoryview(raw)[split:]
+
+    def __getitem__(self, i):
+        if self.states[i] != PRESENT:
+            return None
+        if self._data is None:
+            self._inflate()
+        value = str(self._data[self._offsets[i]:self._offsets[i + 1]], "utf-8")
+        return json.loads(value) if self._as_json else value
+
+
+class _DictionaryColumn(_Column):
+    def __init__(self, buf, rows):
+        super().__init__(buf, rows)
+        start = self._payload
+        (entries,) = struct.unpack_from("=I", buf, start)
+        offsets_start = start + 8
+        offsets = buf[offsets_start:offsets_start + (entries + 1) * 8].cast("Q")
+        data_start = offsets_start + (entries + 1) * 8
+        data = buf[data_start:data_start + offsets[entries]]
+        # Dictionaries are tiny, decode them once
+        self.dictionary = [str(data[offsets[k]:offsets[k + 1]], "utf-8") for k in range(entries)]
+        codes_start = start + _align(data_start - start + offsets[entries])
+        offsets.release()
+        data.release()
+        self.codes = buf[codes_start:codes_start + rows * 4].cast("I")
+
+    def __getitem__(self, i):
+        return self.dictionary[self.codes[i]] if self.states[i] == PRESENT else None
+
+
+class _NumberColumn(_Column):
+    def __init__(self, buf, rows, typecode):
+        super().__init__(buf, rows)
+        start = self._payload
+        self.values = buf[start:start + rows * 8].cast(typecode)
+
+    def __getitem__(self, i):
+        return self.values[i] if self.states[i] == PRESENT else None
+
+
+class _BoolColumn(_Column):
+    def __init__(self, buf, rows):
+        super().__init__(buf, rows)
+        start = self._payload
+        self.values = buf[start:start + rows]
+
+    def __getitem__(self, i):
+        return bool(self.values[i]) if self.states[i] == PRESENT else None
+
+
+class LeadSnapshot:
+    """
+    Memory-mapped, read-only view of a snapshot written by write_snapshot().
+    Rows are decoded lazily, so iterating millions of leads keeps memory flat.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = memoryview(self._mmap)
+        self._columns = {}
+        try:
+            self._read_header()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_header(self):
+        if self._buf[:4] != MAGIC:
+            raise ValueError(f"{self.path} is not a lead snapshot")
+        version, byteorder, self.rows, count = struct.unpack_from("=BBIH", self._buf, 4)
+        if version != VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version}")
+        if byteorder != BYTEORDER[sys.byteorder]:
+            raise ValueError("Snapshot was written on a machine with a different byte order")
+
+        pos = 4 + struct.calcsize("=BBIH")
+        for _ in range(count):
+            (name_len,) = struct.unpack_from("=H", self._buf, pos)
+            pos += 2
+            name = str(self._buf[pos:pos + name_len], "utf-8")
+            pos += name_len
+            kind, offset, size = struct.unpack_from("=cQQ", self._buf, pos)
+            pos += struct.calcsize("=cQQ")
+            block = self._buf[offset:offset + size]
+            kind = kind.decode("ascii")
+            if kind == "d":
+                column = _DictionaryColumn(block, self.rows)
+            elif kind == "i":
+                column = _NumberColumn(block, self.rows, "q")
+            elif kind == "f":
+                column = _NumberColumn(block, self.rows, "d")
+            elif kind == "b":
+                column = _BoolColumn(block, self.rows)
+            else:
+                column = _StringColumn(block, self.rows, as_json=(kind == "j"))
+            self._columns[name] = column
+
+    @property
+    def columns(self):
+        return list(self._columns)
+
+    def column(self, name):
+        """
+        Returns the raw column object. Numeric columns expose `.values` and
+        dictionary columns expose `.codes` / `.dictionary` as zero-copy views.
+        Views derived from them (e.g. slices) must be released before close().
+        """
+        return self._columns[name]
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.rows
+        if not 0 <= i < self.rows:
+            raise IndexError("Lead index out of range")
+        lead = {}
+        for name, column in self._columns.items():
+            if column.present(i):
+                lead[name] = column[i]
+        return lead
+
+    def __iter__(self):
+        for i in range(self.rows):
+            yield self[i]
+
+    def close(self):
+        try:
+            # Release every exported view before closing the mapping
+            for column in self._columns.values():
+                for view in vars(column).values():
+                    if isinstance(view, memoryview):
+                        view.release()
+            self._columns = {}
+            if getattr(self, "_buf", None) is not None:
+                self._buf.release()
+                self._buf = None
+            if getattr(self, "_mmap", None) is not None:
+                # Raises BufferError while a caller still holds a derived view
+                self._mmap.close()
+                self._mmap = None
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_leads(path):
+    """
+    Opens either a snapshot or a plain JSON lead file.
+    Snapshots are memory-mapped, JSON files are parsed into a list.
+    """
+    if path.endswith(SNAPSHOT_EXTENSION):
+        return LeadSnapshot(path)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_ndjson(rows, path):
+    """
+    Streams rows to a newline-delimited JSON file, one object per line.
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def write_csv(rows, path, fields):
+    """
+    Streams rows to a CSV file. Keys not listed in `fields` are dropped.
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+class CampaignWriter:
+    """
+    Appends campaign results to NDJSON and CSV files as they are produced,
+    instead of holding the whole campaign in memory until the end.
+    """
+
+    def __init__(self, ndjson_path, csv_path=None):
+        self.ndjson_path = ndjson_path
+        self.csv_path = csv_path
+        self.count = 0
+        self._csv = None
+        with ExitStack() as stack:
+            self._ndjson = stack.enter_context(open(ndjson_path, "w", encoding="utf-8"))
+            if csv_path:
+                csv_file = stack.enter_context(open(csv_path, "w", encoding="utf-8", newline=""))
+                self._csv = csv.DictWriter(csv_file, fieldnames=CAMPAIGN_CSV_FIELDS, extrasaction="ignore")
+                self._csv.writeheader()
+            # Opened files are closed by close(), or right here if anything above fails
+            self._files = stack.pop_all()
+
+    def write(self, company, email):
+        self._ndjson.write(json.dumps({"company": company, "email": email}, ensure_ascii=False))
+        self._ndjson.write("\n")
+        if self._csv:
+            self._csv.writerow({"company": company, **email})
+        self.count += 1
+
+    def close(self):
+        self._files.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Export the lead corpus to compact snapshot or streaming formats')
+    parser.add_argument('source', type=str, help='Lead file (.json or .agls)')
+    parser.add_argument('target', type=str, help='Output file (.agls, .ndjson, .jsonl or .csv)')
+    args = parser.parse_args()
+
+    if not args.target.endswith((SNAPSHOT_EXTENSION, ".csv", ".ndjson", ".jsonl")):
+        parser.error("target must end with .agls, .csv, .ndjson or .jsonl")
+
+    source = load_leads(args.source)
+    if args.target.endswith(SNAPSHOT_EXTENSION):
+        count = write_snapshot(source, args.target)
+    elif args.target.endswith(".csv"):
+        fields = source.columns if isinstance(source, LeadSnapshot) else list(dict.fromkeys(k for l in source for k in l))
+        count = write_csv(source, args.target, fields)
+    else:
+        count = write_ndjson(source, args.target)
+    if isinstance(source, LeadSnapshot):
+        source.close()
+    print(f"✅ Exported {count} leads to {args.target}")
@@ -1,6 +1,7 @@
 import json
 import sys
 from analyst import scrape_homepage_content
+from exporter import load_leads, LeadSnapshot
 
 
 def process_lead(lead, deep_analysis=False):
@@ -71,21 +72,24 @@ def process_lead(lead, deep_analysis=False):
 
 
 def main():
+    # Optional path to a lead file; .agls snapshots are memory-mapped and scanned lazily
+    path = sys.argv[1] if len(sys.argv) > 1 else "/Users/jansindelovsky/.gemini/antigravity/scratch/antigravity-agency/leads_sample.json"
     try:
-        with open("/Users/jansindelovsky/.gemini/antigravity/scratch/antigravity-agency/leads_sample.json", "r") as f:
-            leads = json.load(f)
+        leads = load_leads(path)
     except FileNotFoundError:
         print("Sample file not found.")
         return
 
-    results = []
-    for lead in leads:
-        results.append({
-            "lead_name": lead.get("company_name"),
-            "result": process_lead(lead)
-        })
-
-    print(json.dumps(results, indent=2, ensure_ascii=False))
+    # Results are printed as NDJSON, one lead per line, so memory stays flat
+    try:
+        for lead in leads:
+            print(json.dumps({
+                "lead_name": lead.get("company_name"),
+                "result": process_lead(lead)
+            }, ensure_ascii=False))
+    finally:
+        if isinstance(leads, LeadSnapshot):
+            leads.close()
 
 if __name__ == "__main__":
     main()
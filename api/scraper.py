@@ -4,6 +4,7 @@ import argparse
 import time
 from apify_client import ApifyClient
 from dotenv import load_dotenv
+from search_index import index_leads
 
 load_dotenv()
 
@@ -25,17 +26,19 @@ def save_leads_to_file(leads):
     existing_urls = {l.get("url") for l in existing_leads if l.get("url")}
     merged_leads = existing_leads
     
-    added_count = 0
+    added_leads = []
     for nl in leads:
         if nl.get("url") and nl.get("url") not in existing_urls:
             merged_leads.append(nl)
             existing_urls.add(nl.get("url"))
-            added_count += 1
+            added_leads.append(nl)
 
     with open(LEADS_FILE, "w", encoding="utf-8") as f:
         json.dump(merged_leads, f, indent=2, ensure_ascii=False)
+
+    index_leads(added_leads)
     
-    return added_count
+    return len(added_leads)
 
 def scrape_leads_apify(niche, location, limit=20):
     """
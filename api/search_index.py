@@ -0,0 +1,155 @@
+import argparse
+import json
+import os
+import re
+import sqlite3
+
+INDEX_FILE = os.path.join(os.path.dirname(__file__), "leads_index.db")
+
+# unicode61 with remove_diacritics 2 folds Czech letters (č -> c, ř -> r, ů -> u),
+# so "strechy" matches "Střechy" and vice versa.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    url TEXT UNIQUE NOT NULL,
+    company_name TEXT,
+    category TEXT,
+    city TEXT,
+    content TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    company_name, category, city, content,
+    content='documents', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+    INSERT INTO documents_fts(rowid, company_name, category, city, content)
+    VALUES (new.id, new.company_name, new.category, new.city, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+    INSERT INTO documents_fts(documents_fts, rowid, company_name, category, city, content)
+    VALUES ('delete', old.id, old.company_name, old.category, old.city, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_au AFTER UPDATE ON documents BEGIN
+    INSERT INTO documents_fts(documents_fts, rowid, company_name, category, city, content)
+    VALUES ('delete', old.id, old.company_name, old.category, old.city, old.content);
+    INSERT INTO documents_fts(rowid, company_name, category, city, content)
+    VALUES (new.id, new.company_name, new.category, new.city, new.content);
+END;
+"""
+
+# Existing content is kept when a lead is re-indexed without fresh homepage text
+UPSERT = """
+INSERT INTO documents (url, company_name, category, city, content)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(url) DO UPDATE SET
+    company_name = excluded.company_name,
+    category = excluded.category,
+    city = excluded.city,
+    content = COALESCE(excluded.content, documents.content)
+"""
+
+SCRAPE_ERROR_PREFIX = "Could not scrape content"
+
+
+def connect(path=INDEX_FILE):
+    # The index is a rebuildable cache that may be deleted at any time,
+    # so the (cheap, idempotent) schema script runs on every connect
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    try:
+        conn.executescript(SCHEMA)
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+
+def index_leads(leads, contents=None, path=INDEX_FILE):
+    """
+    Adds or refreshes leads in the full-text index, keyed by URL.
+    `contents` optionally maps URL -> scraped homepage text.
+    Returns the number of indexed leads.
+
+    The index is a secondary store: failures are logged and 0 is returned,
+    so the calling operation still succeeds.
+    """
+    contents = contents or {}
+    rows = []
+    for lead in leads:
+        url = lead.get("url")
+        if not url:
+            continue
+        content = contents.get(url)
+        if content and content.startswith(SCRAPE_ERROR_PREFIX):
+            content = None
+        rows.append((url, lead.get("company_name"), lead.get("category"), lead.get("city"), content or None))
+
+    try:
+        conn = connect(path)
+        try:
+            with conn:
+                conn.executemany(UPSERT, rows)
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"❌ Search index error: {str(e)}")
+        return 0
+    return len(rows)
+
+
+def index_lead(lead, content=None, path=INDEX_FILE):
+    """
+    Indexes a single lead, optionally together with its homepage text.
+    """
+    contents = {lead.get("url"): content} if content else None
+    return index_leads([lead], contents, path)
+
+
+def _build_match_query(query):
+    # Quote every term so user input can never be parsed as FTS5 syntax,
+    # and allow prefix matches ("zub" finds "zubař")
+    terms = re.findall(r"\w+", query)
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def search_leads(query, limit=20, path=INDEX_FILE):
+    """
+    Runs a keyword search across company name, category, city and homepage text.
+    Results are ordered by BM25 relevance.
+    """
+    match = _build_match_query(query)
+    if not match or not os.path.exists(path):
+        return []
+
+    conn = connect(path)
+    try:
+        rows = conn.execute(
+            """
+            SELECT d.url, d.company_name, d.category, d.city,
+                   snippet(documents_fts, 3, '[', ']', '…', 12) AS snippet
+            FROM documents_fts
+            JOIN documents d ON d.id = documents_fts.rowid
+            WHERE documents_fts MATCH ?
+            ORDER BY bm25(documents_fts)
+            LIMIT ?
+            """,
+            (match, limit),
+        ).fetchall()
+    finally:
+        conn.close()
+    return [dict(row) for row in rows]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Full-text search index over harvested leads')
+    parser.add_argument('--rebuild', type=str, help='Index every lead from this JSON file')
+    parser.add_argument('--query', type=str, help='Search the index')
+    args = parser.parse_args()
+
+    if args.rebuild:
+        with open(args.rebuild, "r", encoding="utf-8") as f:
+            count = index_leads(json.load(f))
+        print(f"✅ Indexed {count} leads into {INDEX_FILE}")
+    if args.query:
+        print(json.dumps(search_leads(args.query), indent=2, ensure_ascii=False))
@@ -1,5 +1,6 @@
-from fastapi import FastAPI, HTTPException, APIRouter, Request
+from fastapi import FastAPI, HTTPException, APIRouter, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 import json
 import os
@@ -7,6 +8,8 @@ import subprocess
 from .enricher import enrich_lead_with_apollo
 from .ads_detector import detect_google_ads
 from .auditor import run_performance_audit
+from .analyst import scrape_homepage_content
+from .search_index import index_lead, search_leads
 
 app = FastAPI(title="Antigravity LeadGen CRM API")
 
@@ -21,6 +24,10 @@ app.add_middleware(
 
 LEADS_FILE = os.path.join(os.path.dirname(__file__), "leads_discovered.json")
 
+def index_homepage(lead):
+    # Blocking scrape + SQLite write; errors are logged by index_lead, not raised
+    index_lead(lead, scrape_homepage_content(lead.get("url", "")))
+
 class SearchRequest(BaseModel):
     niche: str
     location: str
@@ -42,6 +49,13 @@ async def get_leads():
         except:
             return []
 
+@api_router.get("/search")
+async def search_api(q: str, limit: int = Query(20, ge=1, le=100)):
+    try:
+        return search_leads(q, limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @api_router.post("/discover")
 async def discover_leads_api(request: SearchRequest):
     try:
@@ -79,6 +93,8 @@ async def audit_lead(lead_id: int):
             lead.update(audit_res)
             with open(LEADS_FILE, "w") as f:
                 json.dump(leads, f, indent=2, ensure_ascii=False)
+            # Store the homepage text for full-text search without blocking the event loop
+            await run_in_threadpool(index_homepage, lead)
             return lead
         else:
             raise HTTPException(status_code=500, detail="Audit failed")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The api modules import each other as top-level scripts (e.g. `from analyst import ...`)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
@@ -0,0 +1,185 @@
+import csv
+import json
+import os
+
+import pytest
+
+from exporter import CampaignWriter, LeadSnapshot, write_csv, write_ndjson, write_snapshot
+
+
+LEADS = [
+    {
+        "company_name": "Střechy Praha s.r.o.",
+        "url": "https://strechy-praha.cz",
+        "location": None,
+        "phone_number": "+420 777 000 000",
+        "city": "Praha",
+        "category": "Roofer",
+        "uses_ads": True,
+        "performance_score": 45,
+        "lcp_value": 5.2,
+    },
+    {
+        "company_name": "Zubař Brno",
+        "url": "https://zubar-brno.cz",
+        "location": "Brno",
+        "phone_number": None,
+        "city": None,
+        "category": "Dentist",
+    },
+    {
+        "company_name": "Truhlářství Kolín",
+        "url": "https://truhlar.cz",
+        "city": "Praha",
+        "category": "Roofer",
+        "uses_ads": False,
+        "performance_score": -3,
+        "lcp_value": None,
+        "tags": ["a", 1],
+        "huge": 2**64,
+    },
+]
+
+
+def test_round_trip_matches_json(tmp_path):
+    path = str(tmp_path / "leads.agls")
+    assert write_snapshot(LEADS, path) == 3
+
+    with LeadSnapshot(path) as snapshot:
+        assert len(snapshot) == 3
+        assert list(snapshot) == LEADS
+        assert snapshot[-1] == LEADS[-1]
+        with pytest.raises(IndexError):
+            snapshot[3]
+
+
+def test_missing_and_null_stay_distinct(tmp_path):
+    path = str(tmp_path / "leads.agls")
+    write_snapshot(LEADS, path)
+
+    with LeadSnapshot(path) as snapshot:
+        assert "location" in snapshot[0] and snapshot[0]["location"] is None
+        assert "location" not in snapshot[2]
+        assert snapshot[1]["city"] is None
+        assert "uses_ads" not in snapshot[1]
+
+
+def test_dictionary_and_numeric_columns(tmp_path):
+    path = str(tmp_path / "leads.agls")
+    write_snapshot(LEADS, path)
+
+    with LeadSnapshot(path) as snapshot:
+        city = snapshot.column("city")
+        assert city.dictionary == ["Praha"]
+        assert list(city.codes) == [0, 0, 0]
+        assert snapshot.column("performance_score").values[2] == -3
+        assert snapshot.column("huge")[2] == 2**64
+
+
+def test_mixed_int_float_column_keeps_types(tmp_path):
+    leads = [{"lcp_value": 5}, {"lcp_value": 5.2}, {"lcp_value": 2**60 + 1}, {"lcp_value": 1.5}]
+    path = str(tmp_path / "leads.agls")
+    write_snapshot(leads, path)
+
+    with LeadSnapshot(path) as snapshot:
+        values = [lead["lcp_value"] for lead in snapshot]
+    assert values == [5, 5.2, 2**60 + 1, 1.5]
+    assert [type(v) for v in values] == [int, float, int, float]
+
+
+def test_string_columns_are_compressed(tmp_path):
+    leads = [{"company_name": "Střechy Praha s.r.o.", "location": "Praha 1"} for _ in range(1000)]
+    path = str(tmp_path / "leads.agls")
+    write_snapshot(leads, path)
+
+    assert os.path.getsize(path) < len(json.dumps(leads)) / 10
+    with LeadSnapshot(path) as snapshot:
+        assert snapshot[999] == leads[999]
+
+
+def test_empty_input(tmp_path):
+    path = str(tmp_path / "empty.agls")
+    assert write_snapshot([], path) == 0
+
+    with LeadSnapshot(path) as snapshot:
+        assert len(snapshot) == 0
+        assert snapshot.columns == []
+        assert list(snapshot) == []
+
+
+def test_failed_write_removes_temp_file(tmp_path):
+    path = str(tmp_path / "missing_dir" / "leads.agls")
+    with pytest.raises(FileNotFoundError):
+        write_snapshot(LEADS, path)
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_close_releases_file_even_with_live_views(tmp_path):
+    path = str(tmp_path / "leads.agls")
+    write_snapshot(LEADS, path)
+
+    snapshot = LeadSnapshot(path)
+    view = snapshot.column("performance_score").values[0:2]
+    with pytest.raises(BufferError):
+        snapshot.close()
+    assert snapshot._file.closed
+    view.release()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "leads.json"
+    path.write_text(json.dumps(LEADS))
+    with pytest.raises(ValueError):
+        LeadSnapshot(str(path))
+
+
+def test_streaming_exports(tmp_path):
+    ndjson_path = str(tmp_path / "leads.ndjson")
+    csv_path = str(tmp_path / "leads.csv")
+
+    assert write_ndjson(iter(LEADS), ndjson_path) == 3
+    with open(ndjson_path, encoding="utf-8") as f:
+        assert [json.loads(line) for line in f] == LEADS
+
+    assert write_csv(iter(LEADS), csv_path, ["company_name", "city"]) == 3
+    with open(csv_path, encoding="utf-8") as f:
+        assert f.readline().strip() == "company_name,city"
+
+
+def test_campaign_writer(tmp_path):
+    ndjson_path = str(tmp_path / "campaign.ndjson")
+    csv_path = str(tmp_path / "campaign.csv")
+    drafts = [
+        ("Střechy Praha s.r.o.", {"status": "ready_to_send", "subject": "Technický stav webu", "email_body": "Dobrý den,\n\nřádek", "phone_number": None, "reasoning": "CZ"}),
+        ("Roofers LLC", {"status": "ready_to_send", "subject": "Technical health", "email_body": "Hello", "phone_number": "+1 555", "reasoning": "US"}),
+    ]
+
+    with CampaignWriter(ndjson_path, csv_path) as campaign:
+        for company, email in drafts:
+            campaign.write(company, email)
+    assert campaign.count == 2
+
+    with open(ndjson_path, encoding="utf-8") as f:
+        assert [json.loads(line) for line in f] == [{"company": c, "email": e} for c, e in drafts]
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["company"] for row in rows] == ["Střechy Praha s.r.o.", "Roofers LLC"]
+    assert rows[0]["email_body"] == "Dobrý den,\n\nřádek"
+    assert rows[1]["phone_number"] == "+1 555"
+
+
+def test_campaign_writer_closes_ndjson_when_csv_fails(tmp_path, monkeypatch):
+    opened = []
+    real_open = open
+
+    def tracking_open(path, *args, **kwargs):
+        if str(path).endswith(".csv"):
+            raise PermissionError(path)
+        f = real_open(path, *args, **kwargs)
+        opened.append(f)
+        return f
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+    with pytest.raises(PermissionError):
+        CampaignWriter(str(tmp_path / "campaign.ndjson"), str(tmp_path / "campaign.csv"))
+    assert opened and all(f.closed for f in opened)
@@ -0,0 +1,91 @@
+import os
+import sqlite3
+
+import search_index
+from search_index import index_lead, index_leads, search_leads
+
+
+LEADS = [
+    {"company_name": "Střechy Praha s.r.o.", "url": "https://strechy-praha.cz", "city": "Praha", "category": "Roofer"},
+    {"company_name": "Zubní klinika Brno", "url": "https://zubar-brno.cz", "city": "Brno", "category": "Dentist"},
+]
+
+
+def test_diacritic_folding(tmp_path):
+    path = str(tmp_path / "index.db")
+    assert index_leads(LEADS, path=path) == 2
+
+    assert [r["url"] for r in search_leads("strechy", path=path)] == ["https://strechy-praha.cz"]
+    assert [r["url"] for r in search_leads("zubni", path=path)] == ["https://zubar-brno.cz"]
+    assert [r["url"] for r in search_leads("Zubní", path=path)] == ["https://zubar-brno.cz"]
+
+
+def test_homepage_content_is_searchable(tmp_path):
+    path = str(tmp_path / "index.db")
+    index_lead(LEADS[1], "Moderní dentální hygiena a bělení zubů", path=path)
+
+    results = search_leads("beleni", path=path)
+    assert results[0]["url"] == "https://zubar-brno.cz"
+    assert "[bělení]" in results[0]["snippet"]
+
+
+def test_metadata_update_keeps_content(tmp_path):
+    path = str(tmp_path / "index.db")
+    index_lead(LEADS[1], "Moderní dentální hygiena", path=path)
+    index_lead(dict(LEADS[1], city="Olomouc"), path=path)
+
+    results = search_leads("hygiena", path=path)
+    assert len(results) == 1
+    assert results[0]["city"] == "Olomouc"
+    assert search_leads("olomouc", path=path)[0]["url"] == "https://zubar-brno.cz"
+
+
+def test_scrape_errors_are_not_indexed(tmp_path):
+    path = str(tmp_path / "index.db")
+    index_lead(LEADS[0], "Could not scrape content: timeout", path=path)
+
+    assert search_leads("timeout", path=path) == []
+
+
+def test_fts_syntax_injection(tmp_path):
+    path = str(tmp_path / "index.db")
+    index_leads(LEADS, path=path)
+
+    assert search_leads('"; DROP TABLE documents; --', path=path) == []
+    assert search_leads("NEAR(praha brno) OR *", path=path) == []
+    assert search_leads("praha)", path=path)[0]["url"] == "https://strechy-praha.cz"
+    assert search_leads("", path=path) == []
+
+
+def test_limit(tmp_path):
+    path = str(tmp_path / "index.db")
+    index_leads([{"company_name": f"Firma {i}", "url": f"https://firma{i}.cz"} for i in range(30)], path=path)
+
+    assert len(search_leads("firma", limit=5, path=path)) == 5
+
+
+def test_index_recovers_after_file_is_deleted(tmp_path):
+    path = str(tmp_path / "index.db")
+    index_leads(LEADS, path=path)
+    os.remove(path)
+
+    assert search_leads("praha", path=path) == []
+    assert index_lead(LEADS[0], path=path) == 1
+    assert search_leads("praha", path=path)[0]["url"] == "https://strechy-praha.cz"
+
+
+def test_search_on_empty_database(tmp_path):
+    path = tmp_path / "index.db"
+    sqlite3.connect(str(path)).close()
+
+    assert search_leads("praha", path=str(path)) == []
+
+
+def test_index_errors_are_logged_not_raised(tmp_path, monkeypatch, capsys):
+    def broken_connect(path):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(search_index, "connect", broken_connect)
+
+    assert index_leads(LEADS, path=str(tmp_path / "index.db")) == 0
+    assert "database is locked" in capsys.readouterr().out